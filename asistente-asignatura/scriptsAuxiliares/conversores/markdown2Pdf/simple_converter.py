@@ -11,28 +11,126 @@ carpetas completas dentro del proyecto teaching-agent.
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import json
+import os
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 DEFAULT_HIGHLIGHT = "pygments"
 HIGHLIGHT_FILE = Path(__file__).with_name("pandoc-highlight.theme")
-SUPPORTED_FORMATS = {"pdf", "docx"}
+# Opciones de Pandoc por formato. El PDF se genera en dos etapas: Pandoc produce
+# HTML por su salida estándar y WeasyPrint lo lee de una tubería del sistema.
+FORMAT_OPTIONS: dict[str, tuple[str, ...]] = {
+    "pdf": ("--to", "html5"),
+    "docx": (),
+}
+# Opciones de WeasyPrint para la salida definitiva: recomprime las imágenes sin
+# pérdida (las fuentes ya se recortan por defecto) para generar PDF más ligeros.
+WEASYPRINT_OPTIONS = ("--optimize-images",)
+# Opciones del modo borrador (--fast): WeasyPrint omite la compresión de los
+# flujos PDF y el recorte de fuentes, a cambio de archivos más grandes.
+WEASYPRINT_FAST_OPTIONS = ("--uncompressed-pdf", "--full-fonts")
+# Cada conversión lanza sus propios procesos Pandoc/WeasyPrint, por lo que no
+# compensa usar todos los núcleos: se limita a 5 trabajos simultáneos.
+DEFAULT_JOBS = min(5, os.cpu_count() or 1)
+CACHE_FILENAME = ".md2pdf-cache.json"
+COMBINED_STEM = "combined"
 
 
 class ConversionError(RuntimeError):
     """Error específico de conversión."""
 
 
-def _run_command(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
+class ConversionCache:
+    """Registro de conversiones previas indexado por el SHA-256 de cada Markdown.
+
+    Se guarda como ``CACHE_FILENAME`` en la raíz convertida y permite saltar los
+    archivos cuyo contenido no ha cambiado y cuya salida sigue intacta en disco.
+    """
+
+    def __init__(
+        self, root: Path, entries: dict[str, dict] | None = None, force: bool = False
+    ) -> None:
+        self.root = root
+        self.force = force
+        self._entries = entries if entries is not None else {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, root: Path, force: bool = False) -> ConversionCache:
+        """Lee la caché de ``root`` o empieza una vacía si no existe o es inválida."""
+
+        try:
+            entries = json.loads((root / CACHE_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+        return cls(root, entries if isinstance(entries, dict) else {}, force)
+
+    def save(self) -> None:
+        """Escribe la caché en disco."""
+
+        with self._lock:
+            content = json.dumps(self._entries, indent=2, sort_keys=True)
+        (self.root / CACHE_FILENAME).write_text(content + "\n", encoding="utf-8")
+
+    def _key(self, markdown_file: Path) -> str:
+        return markdown_file.relative_to(self.root).as_posix()
+
+    def is_fresh(self, markdown_file: Path, digest: str, fmt: str) -> bool:
+        """Indica si la salida ``fmt`` corresponde al contenido actual del Markdown."""
+
+        if self.force:
+            return False
+        entry = self._entries.get(self._key(markdown_file))
+        if not entry or entry.get("sha256") != digest:
+            return False
+        recorded = entry.get("outputs", {}).get(fmt)
+        try:
+            current = output_path_for(markdown_file, fmt).stat().st_mtime_ns
+        except OSError:
+            return False
+        return recorded == current
+
+    def record(self, markdown_file: Path, digest: str, fmt: str) -> None:
+        """Anota una salida recién generada para ``markdown_file``."""
+
+        mtime = output_path_for(markdown_file, fmt).stat().st_mtime_ns
+        with self._lock:
+            entry = self._entries.setdefault(self._key(markdown_file), {})
+            if entry.get("sha256") != digest:
+                entry.clear()
+                entry.update(sha256=digest, outputs={})
+            entry["outputs"][fmt] = mtime
+
+
+def output_path_for(markdown_path: Path, fmt: str) -> Path:
+    """Devuelve la ruta de salida de ``markdown_path`` para el formato ``fmt``."""
+
+    return markdown_path.with_suffix(f".{fmt}")
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _run_command(
+    command: Sequence[str], input: str | None = None
+) -> subprocess.CompletedProcess[str]:
     """Ejecuta un comando y devuelve el resultado si todo va bien."""
 
     try:
         completed = subprocess.run(
             list(command),
             check=True,
-            text=True,
+            input=input,
+            encoding="utf-8",
             capture_output=True,
         )
     except FileNotFoundError as exc:  # pragma: no cover - depende del entorno
@@ -40,17 +138,96 @@ def _run_command(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
             f"No se encontró el comando requerido: {command[0]}"
         ) from exc
     except subprocess.CalledProcessError as exc:  # pragma: no cover - ejecución manual
-        stderr = exc.stderr.strip() if exc.stderr else ""
-        stdout = exc.stdout.strip() if exc.stdout else ""
-        details = "\n".join(filter(None, [stdout, stderr]))
-        raise ConversionError(
-            f"La ejecución de '{command[0]}' falló con código {exc.returncode}."
-            + (f"\n{details}" if details else "")
+        raise _command_failed(
+            command, exc.returncode, exc.stdout or "", exc.stderr or ""
         ) from exc
 
     return completed
 
 
+def _command_failed(
+    command: Sequence[str], returncode: int, stdout: str = "", stderr: str = ""
+) -> ConversionError:
+    """Construye el error de un comando que terminó con ``returncode``."""
+
+    details = "\n".join(filter(None, [stdout.strip(), stderr.strip()]))
+    return ConversionError(
+        f"La ejecución de '{command[0]}' falló con código {returncode}."
+        + (f"\n{details}" if details else "")
+    )
+
+
+def _run_pipeline(
+    producer: Sequence[str], consumer: Sequence[str], input: str | None = None
+) -> None:
+    """Ejecuta ``producer | consumer`` unidos por una tubería del sistema.
+
+    La salida de ``producer`` llega a ``consumer`` sin pasar por Python. Los
+    errores de ambos procesos se vuelcan a archivos temporales y se leen al
+    terminar, de modo que ninguno se bloquea con una tubería llena.
+    """
+
+    with tempfile.TemporaryFile() as producer_log, tempfile.TemporaryFile() as consumer_log:
+        try:
+            first = subprocess.Popen(
+                list(producer),
+                stdin=subprocess.DEVNULL if input is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=producer_log,
+            )
+        except FileNotFoundError as exc:  # pragma: no cover - depende del entorno
+            raise ConversionError(
+                f"No se encontró el comando requerido: {producer[0]}"
+            ) from exc
+
+        try:
+            second = subprocess.Popen(
+                list(consumer),
+                stdin=first.stdout,
+                stdout=consumer_log,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError as exc:
+            # ``producer`` ya está en marcha y no debe quedar huérfano.
+            first.kill()
+            if first.stdin:
+                first.stdin.close()
+            first.wait()
+            if isinstance(exc, FileNotFoundError):  # pragma: no cover - depende del entorno
+                message = f"No se encontró el comando requerido: {consumer[0]}"
+            else:
+                message = f"No se pudo ejecutar '{consumer[0]}': {exc}"
+            raise ConversionError(message) from exc
+        finally:
+            # Solo ``consumer`` debe mantener abierto el extremo de lectura.
+            first.stdout.close()
+
+        if input is not None:
+            try:
+                first.stdin.write(input.encode("utf-8"))
+            except BrokenPipeError:
+                pass  # El código de salida de ``producer`` explica el fallo.
+            finally:
+                first.stdin.close()
+
+        second.wait()
+        first.wait()
+
+        # Si ``consumer`` falla, ``producer`` suele fallar también al perder la
+        # tubería, así que se informan los errores de ambos procesos.
+        errors = []
+        for command, process, log in (
+            (producer, first, producer_log),
+            (consumer, second, consumer_log),
+        ):
+            if process.returncode != 0:
+                log.seek(0)
+                output = log.read().decode("utf-8", "replace")
+                errors.append(str(_command_failed(command, process.returncode, output)))
+        if errors:
+            raise ConversionError("\n".join(errors))
+
+
 def ensure_pandoc() -> None:
     """Comprueba que Pandoc esté disponible."""
 
@@ -79,65 +256,231 @@ def ensure_highlight_style(style_name: str = DEFAULT_HIGHLIGHT) -> Path:
     return HIGHLIGHT_FILE
 
 
-def convert_markdown(
-    markdown_path: Path, formats: Iterable[str], highlight_style: Path
+def _render_pdf(
+    pandoc_command: Sequence[str],
+    ast_json: str | None,
+    output_path: Path,
+    base_url: Path,
+    fast: bool,
+) -> None:
+    """Genera ``output_path`` con WeasyPrint a partir del HTML producido por Pandoc.
+
+    El HTML pasa de Pandoc a WeasyPrint por una tubería, sin escribir archivos
+    intermedios; ``ast_json``, si se indica, se entrega a Pandoc por su entrada
+    estándar y ``base_url`` resuelve las rutas relativas de las imágenes.
+
+    WeasyPrint escribe en una carpeta temporal junto a ``output_path`` y el PDF
+    solo sustituye al existente si ambos procesos terminan bien: si Pandoc
+    falla, WeasyPrint habrá renderizado un HTML vacío o incompleto.
+    """
+
+    options = WEASYPRINT_FAST_OPTIONS if fast else WEASYPRINT_OPTIONS
+    with tempfile.TemporaryDirectory(
+        dir=output_path.parent, prefix=".md2pdf-"
+    ) as staging:
+        staged_pdf = Path(staging) / output_path.name
+        command = [
+            "weasyprint",
+            *options,
+            "--base-url",
+            str(base_url),
+            "-",
+            str(staged_pdf),
+        ]
+        _run_pipeline(pandoc_command, command, input=ast_json)
+        os.replace(staged_pdf, output_path)
+
+
+def _run_pandoc(
+    sources: Sequence[Path],
+    formats: Iterable[str],
+    highlight_style: Path,
+    output_base: Path,
+    fast: bool = False,
+    embed_resources: bool = False,
 ) -> list[Path]:
-    """Convierte un único archivo Markdown a los formatos indicados."""
+    """Ejecuta Pandoc sobre ``sources`` generando ``output_base`` en cada formato.
+
+    Cuando se piden varios formatos, el Markdown se analiza una sola vez: Pandoc
+    vuelca su AST en JSON y cada salida se escribe a partir de ese AST. ``fast``
+    activa el modo borrador de WeasyPrint para la salida PDF. Con
+    ``embed_resources`` Pandoc incrusta las imágenes en el HTML del PDF, ya que
+    WeasyPrint resuelve todas las rutas relativas desde un único directorio.
+    """
 
     outputs: list[Path] = []
+    targets = list(formats)
+    inputs = [str(src) for src in sources]
+    ast_json = None
+    if len(targets) > 1:
+        ast_json = _run_command(["pandoc", *inputs, "--to", "json"]).stdout
+        inputs = ["--from", "json"]
+
+    resource_path = os.pathsep.join(dict.fromkeys(str(src.parent) for src in sources))
     base_command = [
         "pandoc",
-        str(markdown_path),
+        *inputs,
         "--standalone",
         "--resource-path",
-        str(markdown_path.parent),
+        resource_path,
         "--highlight-style",
         str(highlight_style),
     ]
 
-    for fmt in formats:
+    for fmt in targets:
         target_fmt = fmt.lower()
-        if target_fmt not in SUPPORTED_FORMATS:
+        options = FORMAT_OPTIONS.get(target_fmt)
+        if options is None:
             raise ConversionError(f"Formato no soportado: {fmt}")
 
-        output_path = markdown_path.with_suffix(f".{target_fmt}")
-        command = list(base_command)
-
+        output_path = output_path_for(output_base, target_fmt)
         if target_fmt == "pdf":
-            command.extend(["--pdf-engine", "weasyprint"])
-
-        command.extend(["-o", str(output_path)])
-        _run_command(command)
+            command = [*base_command, *options]
+            if embed_resources:
+                command.append("--embed-resources")
+            _render_pdf(command, ast_json, output_path, output_base.parent, fast)
+        else:
+            command = [*base_command, *options, "-o", str(output_path)]
+            _run_command(command, input=ast_json)
         outputs.append(output_path)
 
     return outputs
 
 
-def convert_single_markdown(markdown_file: Path, formats: set[str]) -> bool:
-    """Convierte un archivo Markdown si es válido."""
+def convert_markdown(
+    markdown_path: Path,
+    formats: Iterable[str],
+    highlight_style: Path,
+    fast: bool = False,
+) -> list[Path]:
+    """Convierte un único archivo Markdown a los formatos indicados."""
+
+    return _run_pandoc([markdown_path], formats, highlight_style, markdown_path, fast)
+
+
+def combine_markdowns(
+    markdown_files: Sequence[Path],
+    formats: Iterable[str],
+    highlight_style: Path,
+    output_base: Path,
+    fast: bool = False,
+) -> list[Path]:
+    """Une varios Markdown en un único documento con una sola llamada a Pandoc.
+
+    Las imágenes se buscan en las carpetas de todos los Markdown y se incrustan
+    en el PDF, porque las rutas relativas de los archivos de subcarpetas no
+    existen desde el directorio de ``output_base``.
+    """
+
+    return _run_pandoc(
+        markdown_files, formats, highlight_style, output_base, fast, embed_resources=True
+    )
+
+
+def _convert_markdown_file(
+    markdown_file: Path,
+    formats: set[str],
+    highlight: Path,
+    cache: ConversionCache | None = None,
+    fast: bool = False,
+) -> tuple[bool, list[str]]:
+    """Convierte un archivo Markdown y devuelve el resultado junto a sus mensajes.
+
+    Los mensajes se devuelven en lugar de imprimirse para que las conversiones
+    en paralelo no mezclen su salida.
+    """
 
     if not markdown_file.exists():
-        print(f"Error: El archivo {markdown_file} no existe")
-        return False
+        return False, [f"Error: El archivo {markdown_file} no existe"]
 
     if markdown_file.suffix.lower() != ".md":
-        print(f"Error: El archivo {markdown_file} no es un Markdown")
-        return False
+        return False, [f"Error: El archivo {markdown_file} no es un Markdown"]
 
+    messages: list[str] = []
     try:
-        print(f"Convirtiendo: {markdown_file.name}")
-        highlight = ensure_highlight_style()
-        results = convert_markdown(markdown_file, formats, highlight)
+        digest = _file_digest(markdown_file) if cache else ""
+        pending = {
+            fmt
+            for fmt in formats
+            if not (cache and cache.is_fresh(markdown_file, digest, fmt))
+        }
+        if not pending:
+            return True, [f"= Sin cambios: {markdown_file.name}"]
+
+        messages.append(f"Convirtiendo: {markdown_file.name}")
+        results = convert_markdown(markdown_file, pending, highlight, fast)
         for result in results:
-            print(f"✓ Creado: {result.name}")
-        return True
-    except ConversionError as exc:
-        print(f"✗ Error al convertir {markdown_file.name}: {exc}")
-        return False
-
-
-def convert_directory_markdowns(directory: Path, formats: set[str]) -> tuple[int, int]:
-    """Convierte todos los Markdown dentro de un directorio de forma recursiva."""
+            fmt = result.suffix[1:]
+            if cache and not (fast and fmt == "pdf"):
+                cache.record(markdown_file, digest, fmt)
+            messages.append(f"✓ Creado: {result.name}")
+        return True, messages
+    except (ConversionError, OSError) as exc:
+        # Un Markdown ilegible cuenta como fallo del archivo, no del lote.
+        messages.append(f"✗ Error al convertir {markdown_file.name}: {exc}")
+        return False, messages
+
+
+def convert_single_markdown(
+    markdown_file: Path,
+    formats: set[str],
+    highlight: Path,
+    cache: ConversionCache | None = None,
+    fast: bool = False,
+) -> bool:
+    """Convierte un archivo Markdown si es válido.
+
+    ``highlight`` es el estilo de resaltado ya generado por
+    :func:`ensure_highlight_style`, de modo que los lotes lo resuelven una sola
+    vez. Con ``cache`` se omiten los formatos cuya salida ya corresponde al
+    contenido actual del archivo. Las salidas en modo borrador (``fast``) no se
+    anotan en la caché para que una ejecución normal las regenere.
+    """
+
+    success, messages = _convert_markdown_file(
+        markdown_file, formats, highlight, cache, fast
+    )
+    print("\n".join(messages))
+    return success
+
+
+def _iter_markdown_files(directory: Path) -> Iterator[Path]:
+    """Recorre ``directory`` con ``os.scandir`` devolviendo los Markdown encontrados.
+
+    Se usa una pila explícita en lugar de recursión para que los árboles muy
+    profundos no consuman marcos de Python ni alcancen el límite de recursión.
+    Los subdirectorios sin permiso de lectura se omiten, igual que con
+    ``Path.rglob``.
+    """
+
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name.endswith(".md"):
+                    yield Path(entry.path)
+
+
+def convert_directory_markdowns(
+    directory: Path,
+    formats: set[str],
+    jobs: int = DEFAULT_JOBS,
+    verbose: bool = False,
+    force: bool = False,
+    fast: bool = False,
+) -> tuple[int, int]:
+    """Convierte todos los Markdown dentro de un directorio de forma recursiva.
+
+    Cada archivo se convierte en un proceso Pandoc/WeasyPrint independiente, por
+    lo que se lanzan hasta ``jobs`` conversiones en paralelo. Los archivos sin
+    cambios desde la última ejecución se omiten salvo que ``force`` sea cierto.
+    """
 
     if not directory.exists():
         print(f"Error: El directorio {directory} no existe")
@@ -147,37 +490,95 @@ def convert_directory_markdowns(directory: Path, formats: set[str]) -> tuple[int
         print(f"Error: {directory} no es un directorio válido")
         return 0, 0
 
-    markdown_files = list(directory.rglob("*.md"))
-    if not markdown_files:
-        print(f"No se encontraron archivos Markdown en {directory}")
-        return 0, 0
-
-    print(f"Se encontraron {len(markdown_files)} archivos Markdown en {directory}:")
-    for md_file in markdown_files:
-        print(f"  - {md_file.relative_to(directory)}")
-
-    print("\nIniciando conversión...")
+    print(f"Convirtiendo los Markdown de {directory}...")
     print("-" * 50)
 
+    # Se genera el estilo antes de lanzar los hilos para no crearlo varias veces.
+    highlight = ensure_highlight_style()
+    cache = ConversionCache.load(directory, force)
+    convert = functools.partial(
+        _convert_markdown_file,
+        formats=formats,
+        highlight=highlight,
+        cache=cache,
+        fast=fast,
+    )
+
+    # Los archivos se envían al pool según se descubren, de modo que la
+    # conversión empieza sin esperar a recorrer el árbol completo. Cada hilo
+    # devuelve sus mensajes y solo el hilo principal escribe en la consola.
+    futures = []
+    listing: list[str] = []
     success = 0
-    failed = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for md_file in _iter_markdown_files(directory):
+            futures.append(executor.submit(convert, md_file))
+            if verbose:
+                listing.append(f"  - {md_file.relative_to(directory)}\n")
+        sys.stdout.write("".join(listing))
+
+        for future in futures:
+            converted, messages = future.result()
+            success += converted
+            sys.stdout.write("\n".join(messages) + "\n")
+
+    if not futures:
+        print(f"No se encontraron archivos Markdown en {directory}")
+        return 0, 0
 
-    for md_file in markdown_files:
-        if convert_single_markdown(md_file, formats):
-            success += 1
-        else:
-            failed += 1
+    failed = len(futures) - success
+    cache.save()
 
     print("-" * 50)
-    print("Conversión completada:")
+    print(f"Conversión completada ({len(futures)} archivos Markdown):")
     print(f"  ✓ Exitosas: {success}")
     print(f"  ✗ Fallidas: {failed}")
 
     return success, failed
 
 
-def convert_all_markdowns(formats: set[str]) -> tuple[int, int]:
-    """Convierte la carpeta por defecto de enunciados si existe."""
+def convert_directory_combined(
+    directory: Path, formats: set[str], fast: bool = False
+) -> bool:
+    """Genera un único documento por formato con todos los Markdown del directorio.
+
+    Los archivos se concatenan en orden alfabético de ruta relativa y la salida
+    se escribe como ``COMBINED_STEM`` dentro del propio directorio.
+    """
+
+    if not directory.exists():
+        print(f"Error: El directorio {directory} no existe")
+        return False
+
+    if not directory.is_dir():
+        print(f"Error: {directory} no es un directorio válido")
+        return False
+
+    markdown_files = sorted(
+        _iter_markdown_files(directory),
+        key=lambda path: path.relative_to(directory).as_posix(),
+    )
+    if not markdown_files:
+        print(f"No se encontraron archivos Markdown en {directory}")
+        return False
+
+    try:
+        print(f"Combinando {len(markdown_files)} archivos Markdown de {directory}...")
+        highlight = ensure_highlight_style()
+        output_base = directory / COMBINED_STEM
+        results = combine_markdowns(
+            markdown_files, formats, highlight, output_base, fast
+        )
+        for result in results:
+            print(f"✓ Creado: {result}")
+        return True
+    except ConversionError as exc:
+        print(f"✗ Error al combinar los Markdown de {directory}: {exc}")
+        return False
+
+
+def default_markdown_directory() -> Path | None:
+    """Localiza la carpeta por defecto de enunciados sintéticos."""
 
     script_dir = Path(__file__).parent
     candidate_roots = [
@@ -187,13 +588,40 @@ def convert_all_markdowns(formats: set[str]) -> tuple[int, int]:
 
     for base_path in candidate_roots:
         if base_path.exists():
-            return convert_directory_markdowns(base_path, formats)
+            return base_path
 
     print(
         "Error: No se encontró la carpeta 'enunciados_sinteticos'. "
         "Revise la estructura del proyecto."
     )
-    return 0, 0
+    return None
+
+
+def convert_all_markdowns(
+    formats: set[str],
+    jobs: int = DEFAULT_JOBS,
+    verbose: bool = False,
+    force: bool = False,
+    fast: bool = False,
+) -> tuple[int, int]:
+    """Convierte la carpeta por defecto de enunciados si existe."""
+
+    base_path = default_markdown_directory()
+    if base_path is None:
+        return 0, 0
+    return convert_directory_markdowns(base_path, formats, jobs, verbose, force, fast)
+
+
+def _positive_int(value: str) -> int:
+    """Valida que el argumento sea un entero mayor que cero."""
+
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"'{value}' no es un entero válido") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError("el valor debe ser mayor que cero")
+    return number
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -204,6 +632,8 @@ def build_parser() -> argparse.ArgumentParser:
   python simple_converter.py                        # Convierte todos los Markdown a PDF
   python simple_converter.py -f documento.md --docx  # Convierte un único archivo a DOCX
   python simple_converter.py -d carpeta --pdf --docx # Convierte una carpeta a ambos formatos
+  python simple_converter.py -d carpeta -j 4         # Limita la conversión a 4 archivos en paralelo
+  python simple_converter.py -d carpeta --combine    # Une la carpeta en carpeta/combined.pdf
 """,
     )
 
@@ -225,6 +655,41 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Generar salida en DOCX",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        "--parallel",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help=f"Número de archivos a convertir en paralelo (por defecto: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Listar cada Markdown encontrado antes de convertir",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"Reconvertir aunque el Markdown no haya cambiado (ignora {CACHE_FILENAME})",
+    )
+    parser.add_argument(
+        "--combine",
+        action="store_true",
+        help=(
+            f"Unir todos los Markdown del directorio en '{COMBINED_STEM}.<formato>' "
+            "con una única llamada a Pandoc"
+        ),
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help=(
+            "Modo borrador: PDF sin comprimir y sin recortar fuentes. Es más rápido "
+            "pero genera archivos más grandes, que no se guardan en la caché"
+        ),
+    )
 
     return parser
 
@@ -244,18 +709,45 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if args.combine and args.file:
+        parser.error("--combine solo puede usarse con directorios")
+
     formats = determine_formats(args)
     ensure_dependencies(formats)
 
+    if args.combine:
+        directory = (
+            Path(args.directory) if args.directory else default_markdown_directory()
+        )
+        success = directory is not None and convert_directory_combined(
+            directory, formats, args.fast
+        )
+        sys.exit(0 if success else 1)
+
     if args.file:
-        success = convert_single_markdown(Path(args.file), formats)
+        markdown_file = Path(args.file)
+        cache = ConversionCache.load(markdown_file.parent, args.force)
+        success = convert_single_markdown(
+            markdown_file, formats, ensure_highlight_style(), cache, args.fast
+        )
+        if success:
+            cache.save()
         sys.exit(0 if success else 1)
 
     if args.directory:
-        success, failed = convert_directory_markdowns(Path(args.directory), formats)
+        success, failed = convert_directory_markdowns(
+            Path(args.directory),
+            formats,
+            args.jobs,
+            args.verbose,
+            args.force,
+            args.fast,
+        )
         sys.exit(0 if failed == 0 else 1)
 
-    success, failed = convert_all_markdowns(formats)
+    success, failed = convert_all_markdowns(
+        formats, args.jobs, args.verbose, args.force, args.fast
+    )
     sys.exit(0 if failed == 0 else 1)
 
 
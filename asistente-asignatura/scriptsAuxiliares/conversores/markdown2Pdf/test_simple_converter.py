@@ -0,0 +1,209 @@
+"""Pruebas de la caché incremental del conversor con Pandoc/WeasyPrint simulados."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import simple_converter as converter
+from simple_converter import CACHE_FILENAME, ConversionCache
+
+# Sustitutos mínimos de las CLI: registran cada llamada y escriben una salida
+# derivada del Markdown recibido.
+PANDOC_STUB = """\
+import sys
+args = sys.argv[1:]
+with open({log!r}, "a", encoding="utf-8") as log:
+    log.write("pandoc " + " ".join(args) + "\\n")
+sources = [arg for arg in args if arg.endswith(".md")]
+if sources:
+    data = "".join(open(src, encoding="utf-8").read() for src in sources)
+else:
+    data = sys.stdin.read()
+if "ROTO" in data:
+    sys.exit("pandoc: front matter YAML inválido")
+if "-o" in args:
+    with open(args[args.index("-o") + 1], "w", encoding="utf-8") as out:
+        out.write(data)
+else:
+    sys.stdout.write(data)
+"""
+
+WEASYPRINT_STUB = """\
+import sys
+with open({log!r}, "a", encoding="utf-8") as log:
+    log.write("weasyprint " + " ".join(sys.argv[1:]) + "\\n")
+data = sys.stdin.read()
+with open(sys.argv[-1], "w", encoding="utf-8") as out:
+    out.write(data)
+"""
+
+
+@pytest.fixture
+def calls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Coloca ``pandoc`` y ``weasyprint`` simulados al principio del PATH."""
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "calls.log"
+    log.touch()
+    for name, stub in (("pandoc", PANDOC_STUB), ("weasyprint", WEASYPRINT_STUB)):
+        script = bin_dir / name
+        script.write_text(
+            f"#!{sys.executable}\n" + stub.format(log=str(log)), encoding="utf-8"
+        )
+        script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+@pytest.fixture
+def markdown(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    path = docs / "tema.md"
+    path.write_text("# Tema\n", encoding="utf-8")
+    return path
+
+
+def convert(markdown_file: Path, formats: set[str], force: bool = False, fast: bool = False):
+    """Convierte con la caché de la carpeta del Markdown y la guarda, como ``main``."""
+
+    cache = ConversionCache.load(markdown_file.parent, force)
+    result = converter._convert_markdown_file(
+        markdown_file, formats, markdown_file.parent / "estilo.theme", cache, fast
+    )
+    cache.save()
+    return result
+
+
+def conversions(log: Path) -> int:
+    return log.read_text(encoding="utf-8").count("pandoc ")
+
+
+def cache_entry(markdown_file: Path) -> dict:
+    data = json.loads((markdown_file.parent / CACHE_FILENAME).read_text(encoding="utf-8"))
+    return data[markdown_file.name]
+
+
+def test_unchanged_markdown_is_skipped(calls: Path, markdown: Path) -> None:
+    assert convert(markdown, {"pdf"}) == (True, ["Convirtiendo: tema.md", "✓ Creado: tema.pdf"])
+    assert markdown.with_suffix(".pdf").read_text(encoding="utf-8") == "# Tema\n"
+
+    before = conversions(calls)
+    assert convert(markdown, {"pdf"}) == (True, ["= Sin cambios: tema.md"])
+    assert conversions(calls) == before
+
+
+def test_edited_markdown_is_reconverted(calls: Path, markdown: Path) -> None:
+    convert(markdown, {"pdf", "docx"})
+    assert set(cache_entry(markdown)["outputs"]) == {"pdf", "docx"}
+
+    markdown.write_text("# Tema editado\n", encoding="utf-8")
+    success, messages = convert(markdown, {"pdf"})
+
+    assert success and "✓ Creado: tema.pdf" in messages
+    assert markdown.with_suffix(".pdf").read_text(encoding="utf-8") == "# Tema editado\n"
+    # El DOCX anotado corresponde al contenido anterior y deja de considerarse válido.
+    assert set(cache_entry(markdown)["outputs"]) == {"pdf"}
+
+
+def test_modified_output_is_regenerated(calls: Path, markdown: Path) -> None:
+    convert(markdown, {"pdf"})
+    output = markdown.with_suffix(".pdf")
+    stat = output.stat()
+    os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert convert(markdown, {"pdf"})[1][0] == "Convirtiendo: tema.md"
+
+
+def test_missing_output_is_regenerated(calls: Path, markdown: Path) -> None:
+    convert(markdown, {"pdf"})
+    markdown.with_suffix(".pdf").unlink()
+
+    assert convert(markdown, {"pdf"})[1][0] == "Convirtiendo: tema.md"
+    assert markdown.with_suffix(".pdf").exists()
+
+
+def test_force_ignores_cache(calls: Path, markdown: Path) -> None:
+    convert(markdown, {"pdf"})
+    before = conversions(calls)
+
+    assert convert(markdown, {"pdf"}, force=True)[1][0] == "Convirtiendo: tema.md"
+    assert conversions(calls) == before + 1
+
+
+def test_fast_pdf_is_not_cached(calls: Path, markdown: Path) -> None:
+    convert(markdown, {"pdf", "docx"}, fast=True)
+
+    assert set(cache_entry(markdown)["outputs"]) == {"docx"}
+    assert "--uncompressed-pdf" in calls.read_text(encoding="utf-8")
+    # Una ejecución normal sustituye el borrador, pero no vuelve a generar el DOCX.
+    assert convert(markdown, {"pdf", "docx"})[1][1:] == ["✓ Creado: tema.pdf"]
+
+
+@pytest.mark.parametrize("content", ["{no es json", "[]", ""])
+def test_corrupt_cache_file_is_ignored(calls: Path, markdown: Path, content: str) -> None:
+    (markdown.parent / CACHE_FILENAME).write_text(content, encoding="utf-8")
+
+    assert convert(markdown, {"pdf"})[1][0] == "Convirtiendo: tema.md"
+    assert cache_entry(markdown)["sha256"] == converter._file_digest(markdown)
+
+
+def test_cache_round_trip(markdown: Path) -> None:
+    markdown.with_suffix(".pdf").write_text("pdf", encoding="utf-8")
+    digest = converter._file_digest(markdown)
+    cache = ConversionCache.load(markdown.parent)
+    cache.record(markdown, digest, "pdf")
+    cache.save()
+
+    reloaded = ConversionCache.load(markdown.parent)
+    assert reloaded.is_fresh(markdown, digest, "pdf")
+    assert not reloaded.is_fresh(markdown, digest, "docx")
+    assert not reloaded.is_fresh(markdown, "otro", "pdf")
+    assert not ConversionCache.load(markdown.parent, force=True).is_fresh(
+        markdown, digest, "pdf"
+    )
+
+
+def test_failed_pandoc_keeps_existing_pdf(calls: Path, markdown: Path) -> None:
+    output = markdown.with_suffix(".pdf")
+    output.write_bytes(b"%PDF-1.7 bueno")
+    markdown.write_text("---\nROTO\n", encoding="utf-8")
+
+    success, messages = convert(markdown, {"pdf"}, force=True)
+
+    assert not success
+    assert "front matter YAML inválido" in messages[-1]
+    assert output.read_bytes() == b"%PDF-1.7 bueno"
+    assert sorted(path.name for path in markdown.parent.iterdir()) == [
+        CACHE_FILENAME,
+        "tema.md",
+        "tema.pdf",
+    ]
+
+
+def test_failed_pandoc_keeps_existing_combined_pdf(
+    calls: Path, markdown: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(converter, "HIGHLIGHT_FILE", markdown.parent / "estilo.theme")
+    (markdown.parent / "roto.md").write_text("ROTO\n", encoding="utf-8")
+    combined = markdown.parent / f"{converter.COMBINED_STEM}.pdf"
+    combined.write_bytes(b"%PDF-1.7 combinado")
+
+    assert not converter.convert_directory_combined(markdown.parent, {"pdf"})
+    assert combined.read_bytes() == b"%PDF-1.7 combinado"
+
+
+def test_unusable_weasyprint_is_a_conversion_error(calls: Path, markdown: Path) -> None:
+    (calls.parent / "bin" / "weasyprint").chmod(0o644)
+
+    success, messages = convert(markdown, {"pdf"})
+
+    assert not success
+    assert "No se pudo ejecutar 'weasyprint'" in messages[-1]
+    assert not markdown.with_suffix(".pdf").exists()
@@ -3,7 +3,7 @@
 PDF to Markdown converter using Docling
 Converts PDF files to Markdown format with multiple modes:
 - Single file conversion
-- Directory conversion (with subdirectories)
+- Directory conversion (with subdirectories), processing several PDFs in parallel
 - Default: all PDFs in base_de_conocimiento directory
 
 Features:
@@ -12,104 +12,161 @@ Features:
 - Improved markdown formatting for code snippets
 """
 
+import os
 import sys
+import gc
+import importlib.util
 import re
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import argparse
 
+# Each worker process loads its own Docling models, so the default stays
+# conservative to keep memory usage bounded on large machines.
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Each worker rebuilds its converter after this many PDFs so the memory Docling
+# keeps accumulating during long batches can be released
+MAX_PDFS_PER_CONVERTER = 50
+
+# Checked without importing Docling, which takes seconds to load its stack;
+# the import itself only happens when a converter is first needed
+_HAS_DOCLING = importlib.util.find_spec("docling") is not None
+
+# Docling converter shared by every PDF handled in this process
+_CONVERTER = None
+_CONVERTED_PDFS = 0
+
+# Common code indicators, compiled once at import time. They are kept as
+# separate patterns (not one alternation) because is_likely_code counts how
+# many distinct indicators match, and several of them can overlap.
+_CODE_INDICATORS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\{[^}]*\}',  # Curly braces
+    r'\([^)]*\)[^a-zA-Z]',  # Function calls
+    r'[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*[^=]',  # Variable assignments
+    r'//.*|/\*.*\*/',  # Comments
+    r'#.*',  # Hash comments (Python, C preprocessor)
+    r'public\s+class\s+\w+',  # Java class declaration
+    r'def\s+\w+\s*\(',  # Python function definition
+    r'#include\s*<.*>',  # C/C++ includes
+    r'console\.log\s*\(',  # JavaScript console.log
+    r'System\.out\.println\s*\(',  # Java print
+    r'print\s*\(',  # Python print
+    r'SELECT\s+.*\s+FROM',  # SQL select
+)]
+
+# Every code indicator needs one of these to match somewhere in a block: a
+# brace, parenthesis, equals sign or slash, the words class/select, or a '#'
+# after other text on the line (lines starting with '#' never join a block).
+# Documents without any of them cannot contain detectable code.
+_CODE_HINT_RE = re.compile(r'[{(=/]|class|select|[^#\s][^\n]*#', re.IGNORECASE)
+
+# Patterns to detect code blocks and keywords for different languages
+_CODE_PATTERNS = {
+    'java': {
+        'keywords': ['public class', 'private', 'protected', 'public static void main', 'import java', 
+                    'extends', 'implements', 'interface', 'enum', 'package', '@Override', 'ArrayList', 
+                    'HashMap', 'String[]', 'System.out.println', 'new ArrayList', 'new HashMap'],
+        'extensions': ['.java'],
+        'indicators': ['class ', 'interface ', 'enum ', 'package ', 'import java.']
+    },
+    'python': {
+        'keywords': ['def ', 'class ', 'import ', 'from ', 'if __name__', 'print(', 'input(', 
+                    'len(', 'range(', 'for ', 'while ', 'try:', 'except:', 'finally:', 'with ',
+                    'lambda ', 'yield ', 'return ', 'elif ', 'pass', 'break', 'continue'],
+        'extensions': ['.py'],
+        'indicators': ['def ', 'class ', 'import ', 'from ', 'if __name__']
+    },
+    'cpp': {
+        'keywords': ['#include', 'using namespace', 'int main(', 'class ', 'struct ', 'cout <<', 
+                    'cin >>', 'std::', 'vector<', 'string', 'iostream', 'algorithm'],
+        'extensions': ['.cpp', '.h', '.hpp'],
+        'indicators': ['#include', 'using namespace', 'int main(', 'std::']
+    },
+    'c': {
+        'keywords': ['#include', 'int main(', 'printf(', 'scanf(', 'malloc(', 'free(', 'struct ',
+                    'typedef', 'sizeof(', 'NULL', 'stdio.h', 'stdlib.h'],
+        'extensions': ['.c', '.h'],
+        'indicators': ['#include', 'int main(', 'printf(', 'scanf(']
+    },
+    'javascript': {
+        'keywords': ['function ', 'var ', 'let ', 'const ', 'console.log', 'document.', 'window.',
+                    'addEventListener', 'querySelector', 'getElementById', '=>', 'async ', 'await '],
+        'extensions': ['.js'],
+        'indicators': ['function ', 'console.log', 'document.', '=>']
+    },
+    'sql': {
+        'keywords': ['SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE', 'CREATE TABLE',
+                    'DROP TABLE', 'ALTER TABLE', 'JOIN', 'INNER JOIN', 'LEFT JOIN'],
+        'extensions': ['.sql'],
+        'indicators': ['SELECT ', 'FROM ', 'INSERT ', 'UPDATE ', 'DELETE ', 'CREATE TABLE']
+    }
+}
+
+# Language names indexed by the integer ids detect_language scores with
+_LANGS = tuple(_CODE_PATTERNS)
+
+def _build_language_tokens(group):
+    """Pair each distinct lowercase token of a pattern group with the ids of the languages listing it"""
+    tokens = {}
+    for lang_id, lang in enumerate(_LANGS):
+        for token in _CODE_PATTERNS[lang][group]:
+            tokens.setdefault(token.lower(), []).append(lang_id)
+    return tuple((token, tuple(lang_ids)) for token, lang_ids in tokens.items())
+
+# Built once so detect_language searches each token a single time per block
+# instead of once per language that lists it
+_INDICATOR_TOKENS = _build_language_tokens('indicators')
+_KEYWORD_TOKENS = _build_language_tokens('keywords')
+
+# Most points each language can still gain in the keyword pass, by language id
+_KEYWORD_MAX_SCORE = tuple(len(_CODE_PATTERNS[lang]['keywords']) for lang in _LANGS)
+
 def detect_and_format_code(markdown_content):
     """
     Detect code blocks in markdown content and improve their formatting
     """
-    
-    # Patterns to detect code blocks and keywords for different languages
-    code_patterns = {
-        'java': {
-            'keywords': ['public class', 'private', 'protected', 'public static void main', 'import java', 
-                        'extends', 'implements', 'interface', 'enum', 'package', '@Override', 'ArrayList', 
-                        'HashMap', 'String[]', 'System.out.println', 'new ArrayList', 'new HashMap'],
-            'extensions': ['.java'],
-            'indicators': ['class ', 'interface ', 'enum ', 'package ', 'import java.']
-        },
-        'python': {
-            'keywords': ['def ', 'class ', 'import ', 'from ', 'if __name__', 'print(', 'input(', 
-                        'len(', 'range(', 'for ', 'while ', 'try:', 'except:', 'finally:', 'with ',
-                        'lambda ', 'yield ', 'return ', 'elif ', 'pass', 'break', 'continue'],
-            'extensions': ['.py'],
-            'indicators': ['def ', 'class ', 'import ', 'from ', 'if __name__']
-        },
-        'cpp': {
-            'keywords': ['#include', 'using namespace', 'int main(', 'class ', 'struct ', 'cout <<', 
-                        'cin >>', 'std::', 'vector<', 'string', 'iostream', 'algorithm'],
-            'extensions': ['.cpp', '.h', '.hpp'],
-            'indicators': ['#include', 'using namespace', 'int main(', 'std::']
-        },
-        'c': {
-            'keywords': ['#include', 'int main(', 'printf(', 'scanf(', 'malloc(', 'free(', 'struct ',
-                        'typedef', 'sizeof(', 'NULL', 'stdio.h', 'stdlib.h'],
-            'extensions': ['.c', '.h'],
-            'indicators': ['#include', 'int main(', 'printf(', 'scanf(']
-        },
-        'javascript': {
-            'keywords': ['function ', 'var ', 'let ', 'const ', 'console.log', 'document.', 'window.',
-                        'addEventListener', 'querySelector', 'getElementById', '=>', 'async ', 'await '],
-            'extensions': ['.js'],
-            'indicators': ['function ', 'console.log', 'document.', '=>']
-        },
-        'sql': {
-            'keywords': ['SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE', 'CREATE TABLE',
-                        'DROP TABLE', 'ALTER TABLE', 'JOIN', 'INNER JOIN', 'LEFT JOIN'],
-            'extensions': ['.sql'],
-            'indicators': ['SELECT ', 'FROM ', 'INSERT ', 'UPDATE ', 'DELETE ', 'CREATE TABLE']
-        }
-    }
-    
+    # Plain prose: only the trailing whitespace cleanup below would apply
+    if '```' not in markdown_content and not _CODE_HINT_RE.search(markdown_content):
+        return '\n'.join(line.rstrip() for line in markdown_content.split('\n'))
+
     def detect_language(text_block):
         """Detect the programming language of a text block"""
         text_lower = text_block.lower()
-        scores = {}
-        
-        for lang, patterns in code_patterns.items():
-            score = 0
-            # Check for strong indicators first
-            for indicator in patterns['indicators']:
-                if indicator.lower() in text_lower:
-                    score += 10
-
-            # Check for keywords
-            for keyword in patterns['keywords']:
-                if keyword.lower() in text_lower:
-                    score += 1
-
-            scores[lang] = score
-        
+        scores = [0] * len(_LANGS)
+
+        # Check for strong indicators first
+        for token, lang_ids in _INDICATOR_TOKENS:
+            if token in text_lower:
+                for lang_id in lang_ids:
+                    scores[lang_id] += 10
+
+        # Skip the keywords when no other language could catch up with the
+        # leader even if every one of its keywords matched
+        top_score = max(scores)
+        leader = scores.index(top_score)
+        if top_score and all(top_score > score + max_gain
+                             for lang_id, (score, max_gain) in enumerate(zip(scores, _KEYWORD_MAX_SCORE))
+                             if lang_id != leader):
+            return _LANGS[leader]
+
+        # Check for keywords
+        for token, lang_ids in _KEYWORD_TOKENS:
+            if token in text_lower:
+                for lang_id in lang_ids:
+                    scores[lang_id] += 1
+
         # Return language with highest score, or None if no significant match
-        max_score = max(scores.values()) if scores else 0
+        max_score = max(scores)
         if max_score >= 3:  # Minimum threshold for language detection
-            return max(scores, key=scores.get)
+            return _LANGS[scores.index(max_score)]
         return None
     
     def is_likely_code(text):
         """Determine if a text block is likely to contain code"""
-        # Check for common code indicators
-        code_indicators = [
-            r'\{[^}]*\}',  # Curly braces
-            r'\([^)]*\)[^a-zA-Z]',  # Function calls
-            r'[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*[^=]',  # Variable assignments
-            r'//.*|/\*.*\*/',  # Comments
-            r'#.*',  # Hash comments (Python, C preprocessor)
-            r'public\s+class\s+\w+',  # Java class declaration
-            r'def\s+\w+\s*\(',  # Python function definition
-            r'#include\s*<.*>',  # C/C++ includes
-            r'console\.log\s*\(',  # JavaScript console.log
-            r'System\.out\.println\s*\(',  # Java print
-            r'print\s*\(',  # Python print
-            r'SELECT\s+.*\s+FROM',  # SQL select
-        ]
-        
-        # Count matches
-        matches = sum(1 for pattern in code_indicators if re.search(pattern, text, re.IGNORECASE))
+        # Count how many of the precompiled code indicators match
+        matches = sum(1 for pattern in _CODE_INDICATORS if pattern.search(text))
 
         # Also check for indentation patterns (common in code)
         lines = text.split('\n')
@@ -124,49 +181,41 @@ def detect_and_format_code(markdown_content):
 
     def normalize_block(block):
         """Normalize indentation within a detected code block."""
-        stripped_block = [line.rstrip('\r') for line in block]
-        indents = []
-        for line in stripped_block:
-            if not line.strip():
-                continue
-            leading_spaces = len(line) - len(line.lstrip(' '))
-            leading_tabs = len(line) - len(line.lstrip('\t'))
-            if leading_tabs:
-                indents.append(0)
-            else:
-                indents.append(leading_spaces)
-        if indents:
-            min_indent = min(indents)
-            normalized = [line[min_indent:] if len(line) >= min_indent else line for line in stripped_block]
-        else:
-            normalized = stripped_block
         # Dedent text to remove accidental leading indentation while preserving structure
-        dedented = textwrap.dedent('\n'.join(normalized)).split('\n')
-        return [line.rstrip() for line in dedented]
+        text = '\n'.join(line.rstrip('\r') for line in block)
+        return [line.rstrip() for line in textwrap.dedent(text).split('\n')]
+
+    # Bound methods and the line count are looked up once; this loop visits
+    # every line of the document.
+    n = len(lines)
+    append = processed_lines.append
+    extend = processed_lines.extend
 
-    while i < len(lines):
+    while i < n:
         line = lines[i]
         stripped = line.strip()
 
         # Preserve existing fenced code blocks without modifications
         if stripped.startswith('```'):
-            processed_lines.append(line)
+            append(line)
             i += 1
-            while i < len(lines):
-                processed_lines.append(lines[i])
-                if lines[i].strip().startswith('```'):
+            while i < n:
+                fence_line = lines[i]
+                append(fence_line)
+                if fence_line.strip().startswith('```'):
                     i += 1
                     break
                 i += 1
             continue
 
-        # Check if we're starting a potential code block
-        if stripped and not stripped.startswith('#') and not stripped.startswith('*') and not stripped.startswith('-') and not stripped.startswith('>'):
+        # Check if we're starting a potential code block (headings, list items
+        # and quotes are never code, and all of them are told by the first char)
+        if stripped and stripped[0] not in '#*->':
             block_lines = []
             j = i
 
             # Collect consecutive non-empty lines that might be code, stopping at existing markdown constructs
-            while j < len(lines):
+            while j < n:
                 candidate = lines[j]
                 candidate_stripped = candidate.strip()
                 if not candidate_stripped:
@@ -188,46 +237,104 @@ def detect_and_format_code(markdown_content):
                     normalized_block = normalize_block(block_lines)
 
                     if processed_lines and processed_lines[-1].strip():
-                        processed_lines.append('')
+                        append('')
 
-                    processed_lines.append(f'```{lang_tag}')
-                    processed_lines.extend(normalized_block)
-                    processed_lines.append('```')
-                    processed_lines.append('')
+                    append(f'```{lang_tag}')
+                    extend(normalized_block)
+                    append('```')
+                    append('')
 
                     i = j
                     continue
 
-        processed_lines.append(line.rstrip())
+        append(line.rstrip())
         i += 1
 
     return '\n'.join(processed_lines)
 
+def _get_converter():
+    """Return the process-wide DocumentConverter, creating it on first use
+
+    The converter caches its pipelines (and their layout/OCR models) once they
+    are built, so it is created once per process instead of once per PDF.
+    """
+    global _CONVERTER
+    if _CONVERTER is None:
+        from docling.document_converter import DocumentConverter
+        _CONVERTER = DocumentConverter()
+    return _CONVERTER
+
+def _release_converter_periodically():
+    """Drop the process-wide converter every MAX_PDFS_PER_CONVERTER PDFs"""
+    global _CONVERTER, _CONVERTED_PDFS
+    _CONVERTED_PDFS += 1
+    if _CONVERTED_PDFS % MAX_PDFS_PER_CONVERTER == 0:
+        _CONVERTER = None
+        gc.collect()
+
+def _init_worker():
+    """Warm up the Docling converter when a worker process starts
+
+    DocumentConverter builds its pipelines lazily on the first convert(), so
+    the PDF pipeline (and its layout/OCR models) is initialized here explicitly
+    instead of during the first PDF of each worker.
+    """
+    try:
+        from docling.datamodel.base_models import InputFormat
+        _get_converter().initialize_pipeline(InputFormat.PDF)
+    except Exception as e:
+        # Conversions retry the setup and report their own errors per file
+        # A single write keeps lines from concurrent workers from interleaving
+        sys.stderr.write(f"Warning: could not initialize Docling in worker {os.getpid()}: {e}\n")
+
 def simple_pdf_to_markdown(pdf_path):
-    """Convert PDF to markdown using docling with code formatting"""
+    """Convert PDF to markdown using docling with code formatting
+
+    Conversion errors are raised instead of being turned into an error
+    document, so callers never write a .md that would later look up to date.
+    """
     try:
-        from docling.document_converter import DocumentConverter
+        # Reuse the document converter of this process
+        converter = _get_converter()
+    except ImportError as e:
+        raise RuntimeError(f"docling libraries not available. Please install with: pip install docling ({e})") from e
 
-        # Initialize the document converter
-        converter = DocumentConverter()
+    # Convert PDF using docling
+    result = converter.convert(str(pdf_path))
 
-        # Convert PDF using docling
-        result = converter.convert(str(pdf_path))
+    # Export to markdown
+    raw_markdown = result.document.export_to_markdown()
 
-        # Export to markdown
-        raw_markdown = result.document.export_to_markdown()
-        
-        # Apply code detection and formatting
-        formatted_markdown = detect_and_format_code(raw_markdown)
+    # Apply code detection and formatting
+    return detect_and_format_code(raw_markdown)
 
-        return formatted_markdown
+def _is_up_to_date(pdf_file, md_file):
+    """Return True if md_file exists and is not older than pdf_file"""
+    try:
+        return md_file.stat().st_mtime >= pdf_file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+def _convert_one(pdf_path):
+    """Convert one PDF and write its .md file; returns (path, success, message)
+
+    Runs inside the worker processes used by convert_directory_pdfs, so it
+    reports its result instead of printing.
+    """
+    try:
+        markdown_content = simple_pdf_to_markdown(pdf_path)
+        _release_converter_periodically()
+
+        md_file = pdf_path.with_suffix(".md")
+        with open(md_file, "w", encoding="utf-8") as f:
+            f.write(markdown_content)
+
+        return md_file, True, ""
 
-    except ImportError as e:
-        return f"# {pdf_path.stem}\n\n*Error: docling libraries not available. Please install with: pip install docling*\n*Import error: {str(e)}*\n"
     except Exception as e:
-        return f"# {pdf_path.stem}\n\n*Error converting PDF: {str(e)}*\n"
+        return pdf_path, False, str(e)
 
-def convert_single_pdf(pdf_path):
+def convert_single_pdf(pdf_path, force=False):
     """Convert a single PDF file to markdown"""
     pdf_file = Path(pdf_path)
 
@@ -239,15 +346,20 @@ def convert_single_pdf(pdf_path):
         print(f"Error: File {pdf_path} is not a PDF file")
         return False
 
+    # Write to .md file in same directory
+    md_file = pdf_file.with_suffix(".md")
+
+    # Skip PDFs not modified since their markdown was generated
+    if not force and _is_up_to_date(pdf_file, md_file):
+        print(f"- Up to date: {md_file} (use --force to convert again)")
+        return True
+
     try:
         print(f"Converting: {pdf_file.name}")
 
         # Generate markdown content
         markdown_content = simple_pdf_to_markdown(pdf_file)
 
-        # Write to .md file in same directory
-        md_file = pdf_file.with_suffix(".md")
-
         with open(md_file, "w", encoding="utf-8") as f:
             f.write(markdown_content)
 
@@ -258,8 +370,24 @@ def convert_single_pdf(pdf_path):
         print(f"✗ Error converting {pdf_file.name}: {str(e)}")
         return False
 
-def convert_directory_pdfs(directory_path):
-    """Convert all PDFs in specified directory and subdirectories"""
+def _iter_pdfs(directory):
+    """Yield the PDFs under directory using os.scandir and an explicit stack"""
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except PermissionError:
+            # Unreadable subdirectories are skipped, as Path.rglob did
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.lower().endswith('.pdf'):
+                    yield Path(entry.path)
+
+def convert_directory_pdfs(directory_path, workers=DEFAULT_WORKERS, force=False):
+    """Convert all PDFs in specified directory and subdirectories using a process pool"""
     dir_path = Path(directory_path)
 
     if not dir_path.exists():
@@ -270,51 +398,63 @@ def convert_directory_pdfs(directory_path):
         print(f"Error: {directory_path} is not a directory")
         return 0, 0
 
-    # Find all PDF files
-    pdf_files = list(dir_path.rglob("*.pdf"))
-
-    if not pdf_files:
-        print(f"No PDF files found in {directory_path}")
-        return 0, 0
-
-    print(f"Found {len(pdf_files)} PDF files in {directory_path}:")
-    for pdf in pdf_files:
-        print(f"  - {pdf.relative_to(dir_path)}")
-
-    print("\nStarting conversion...")
-    print("-" * 50)
-    
     successful = 0
     failed = 0
-    
-    for pdf_file in pdf_files:
-        try:
-            print(f"Converting: {pdf_file.relative_to(dir_path)}")
-
-            # Generate markdown content
-            markdown_content = simple_pdf_to_markdown(pdf_file)
-
-            # Write to .md file in same directory
-            md_file = pdf_file.with_suffix(".md")
-            
-            with open(md_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
-            
-            print(f"✓ Created: {md_file.relative_to(dir_path)}")
-            successful += 1
-            
-        except Exception as e:
-            print(f"✗ Error converting {pdf_file.name}: {str(e)}")
-            failed += 1
-    
+
+    pdf_files = []
+    up_to_date = []
+    futures = []
+    executor = None
+    try:
+        # Up-to-date PDFs are skipped here, so a re-run with nothing to do
+        # never starts the workers (each one loads Docling). The rest are
+        # submitted while the tree is walked so the workers start converting
+        # before the whole directory has been listed.
+        for pdf in _iter_pdfs(dir_path):
+            pdf_files.append(pdf)
+            if not force and _is_up_to_date(pdf, pdf.with_suffix(".md")):
+                up_to_date.append(pdf)
+                continue
+            if executor is None:
+                # Docling is CPU-bound Python, so processes (not threads) are used.
+                executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            futures.append(executor.submit(_convert_one, pdf))
+
+        if not pdf_files:
+            print(f"No PDF files found in {directory_path}")
+            return 0, 0
+
+        print(f"Found {len(pdf_files)} PDF files in {directory_path}:")
+        for pdf in pdf_files:
+            print(f"  - {pdf.relative_to(dir_path)}")
+
+        print("\nStarting conversion...")
+        print("-" * 50)
+
+        for pdf in up_to_date:
+            print(f"- Up to date: {pdf.with_suffix('.md').relative_to(dir_path)}")
+
+        for future in futures:
+            path, ok, message = future.result()
+            if ok:
+                print(f"✓ Created: {path.relative_to(dir_path)}")
+                successful += 1
+            else:
+                print(f"✗ Error converting {path.name}: {message}")
+                failed += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
     print("-" * 50)
     print(f"Conversion complete:")
     print(f"  ✓ Successful: {successful}")
+    print(f"  - Up to date: {len(up_to_date)}")
     print(f"  ✗ Failed: {failed}")
     
     return successful, failed
 
-def convert_all_pdfs():
+def convert_all_pdfs(workers=DEFAULT_WORKERS, force=False):
     """Convert all PDFs in base_de_conocimiento directory"""
 
     # Find base_de_conocimiento directory
@@ -325,7 +465,7 @@ def convert_all_pdfs():
         print(f"Error: Base path {base_path} does not exist")
         return
 
-    return convert_directory_pdfs(base_path)
+    return convert_directory_pdfs(base_path, workers, force)
 
 def main():
     """Entry point function for the pdf2md command"""
@@ -337,6 +477,8 @@ Examples:
   python simple_converter.py                    # Convert all PDFs in base_de_conocimiento
   python simple_converter.py -f document.pdf   # Convert single file
   python simple_converter.py -d /path/to/dir   # Convert all PDFs in directory
+  python simple_converter.py -d /path -P 2     # Convert with 2 worker processes
+  python simple_converter.py -d /path --force  # Also convert PDFs whose .md is up to date
         """
     )
 
@@ -345,20 +487,33 @@ Examples:
                       help='Convert a single PDF file')
     group.add_argument('-d', '--directory',
                       help='Convert all PDF files in specified directory (includes subdirectories)')
+    parser.add_argument('-P', '--parallel', type=int, default=DEFAULT_WORKERS,
+                        help=f'Number of PDFs converted in parallel (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--force', action='store_true',
+                        help='Convert PDFs even if their .md is newer than the PDF')
 
     args = parser.parse_args()
 
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+
+    # Fail once here instead of writing an error .md for every PDF
+    if not _HAS_DOCLING:
+        print("Error: docling libraries not available. Please install with: pip install docling "
+              "(or ./run_pdf2md.sh install)")
+        sys.exit(1)
+
     if args.file:
         # Convert single file
-        success = convert_single_pdf(args.file)
+        success = convert_single_pdf(args.file, args.force)
         sys.exit(0 if success else 1)
     elif args.directory:
         # Convert directory
-        successful, failed = convert_directory_pdfs(args.directory)
+        successful, failed = convert_directory_pdfs(args.directory, args.parallel, args.force)
         sys.exit(0 if failed == 0 else 1)
     else:
         # Default: convert all PDFs in base_de_conocimiento
-        successful, failed = convert_all_pdfs()
+        successful, failed = convert_all_pdfs(args.parallel, args.force)
         sys.exit(0 if failed == 0 else 1)
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+"""Tests pinning the output of the code block detection heuristics"""
+
+import pytest
+
+from simple_converter import _CODE_HINT_RE, detect_and_format_code
+
+
+def test_prose_without_code_hints_only_strips_trailing_whitespace():
+    prose = ("Introducción al curso   \n"
+             "Los alumnos deben entregar la práctica antes del viernes.\n"
+             "\n"
+             "Evaluación continua: 40 por ciento.  ")
+
+    # No hint character or word, so the fast path returns before the line loop
+    assert _CODE_HINT_RE.search(prose) is None
+    assert detect_and_format_code(prose) == (
+        "Introducción al curso\n"
+        "Los alumnos deben entregar la práctica antes del viernes.\n"
+        "\n"
+        "Evaluación continua: 40 por ciento."
+    )
+
+
+def test_prose_with_hints_but_no_code_is_left_alone():
+    prose = "Ver el tema 3 (página 12) para más detalles.  \nEntrega: viernes."
+
+    assert _CODE_HINT_RE.search(prose) is not None
+    assert detect_and_format_code(prose) == (
+        "Ver el tema 3 (página 12) para más detalles.\nEntrega: viernes."
+    )
+
+
+def test_unfenced_python_block_is_fenced():
+    markdown = ("Ejemplo de función:\n"
+                "\n"
+                "def suma(a, b):\n"
+                "    resultado = a + b\n"
+                "    return resultado\n"
+                "\n"
+                "Fin del ejemplo.")
+
+    assert detect_and_format_code(markdown) == (
+        "Ejemplo de función:\n"
+        "\n"
+        "```python\n"
+        "def suma(a, b):\n"
+        "    resultado = a + b\n"
+        "    return resultado\n"
+        "```\n"
+        "\n"
+        "\n"
+        "Fin del ejemplo."
+    )
+
+
+def test_unfenced_c_block_is_fenced():
+    # Lines starting with '#' never join a block, so the include stays outside
+    markdown = ("Programa en C:\n"
+                "\n"
+                "#include <stdio.h>\n"
+                "int main() {\n"
+                "    printf(\"hola\\n\");\n"
+                "    return 0;\n"
+                "}\n")
+
+    assert detect_and_format_code(markdown) == (
+        "Programa en C:\n"
+        "\n"
+        "#include <stdio.h>\n"
+        "\n"
+        "```c\n"
+        "int main() {\n"
+        "    printf(\"hola\\n\");\n"
+        "    return 0;\n"
+        "}\n"
+        "```\n"
+        "\n"
+    )
+
+
+def test_indented_block_is_dedented():
+    markdown = "Código:\n\n        x = 1\n        y = x + 1\n"
+
+    assert detect_and_format_code(markdown) == "Código:\n\n```\nx = 1\ny = x + 1\n```\n\n"
+
+
+@pytest.mark.parametrize("block, language", [
+    # '#include' and 'int main(' score for both C and C++; ties go to the
+    # language listed first in _CODE_PATTERNS
+    ("x = 1; // #include <lista.h>\nint main() { return 0; }", "cpp"),
+    # ...and a C-only keyword breaks the tie
+    ("x = 1; // #include <lista.h>\nint main() { printf(\"%d\", x); }", "c"),
+    # 'class ' is a Java and Python indicator, but also a Python keyword
+    ("class Pila = {}\nclass Cola = {}", "python"),
+    # ...while 'public class' and 'private' are Java keywords
+    ("public class Pila {\n    private int tope = 0;\n}", "java"),
+    # Python leads on indicators by more than any rival could gain from
+    # keywords, so the keyword pass is skipped
+    ("import os\nfrom sys import argv\ndef main(x):\n    return x", "python"),
+    # JavaScript leads on indicators, but Python overtakes it on keywords
+    ("console.log(total)\n"
+     "for i in range(len(datos)):\n"
+     "    while i > 0:\n"
+     "        try:\n"
+     "            print(input())\n"
+     "        except:\n"
+     "            pass\n"
+     "        finally:\n"
+     "            break\n"
+     "    continue", "python"),
+])
+def test_shared_indicators_resolve_to_expected_language(block, language):
+    assert detect_and_format_code(f"Código:\n\n{block}\n") == (
+        f"Código:\n\n```{language}\n{block}\n```\n\n"
+    )
+
+
+def test_existing_fences_are_kept_and_unfenced_code_is_detected():
+    markdown = ("Texto inicial\n"
+                "\n"
+                "```java\n"
+                "int x = 1;   \n"
+                "```\n"
+                "\n"
+                "x = 1\n"
+                "print(x)\n"
+                "\n"
+                "```\n"
+                "sin lenguaje\n"
+                "```\n")
+
+    assert detect_and_format_code(markdown) == (
+        "Texto inicial\n"
+        "\n"
+        "```java\n"
+        "int x = 1;   \n"
+        "```\n"
+        "\n"
+        "```\n"
+        "x = 1\n"
+        "print(x)\n"
+        "```\n"
+        "\n"
+        "\n"
+        "```\n"
+        "sin lenguaje\n"
+        "```\n"
+    )